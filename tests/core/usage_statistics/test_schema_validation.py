@@ -9,37 +9,63 @@ from great_expectations.core.usage_statistics.schemas import (
 )
 
 
-def test_anonymized_name_validation():
+def _build_validator(schema):
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@pytest.fixture(scope="module")
+def anonymized_string_validator():
+    return _build_validator(anonymized_string_schema)
+
+
+@pytest.fixture(scope="module")
+def anonymized_datasource_validator():
+    return _build_validator(anonymized_datasource_schema)
+
+
+@pytest.fixture(scope="module")
+def init_payload_validator():
+    return _build_validator(init_payload_schema)
+
+
+@pytest.fixture(scope="module")
+def usage_statistics_record_validator():
+    return _build_validator(usage_statistics_record_schema)
+
+
+def test_anonymized_name_validation(anonymized_string_validator):
     string = "aa41efe0a1b3eeb9bf303e4561ff8392"
-    jsonschema.validate(string, anonymized_string_schema)
+    anonymized_string_validator.validate(string)
 
     with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(string[:5], anonymized_string_schema)
+        anonymized_string_validator.validate(string[:5])
 
 
-def test_anonymized_datasource_validation():
+def test_anonymized_datasource_validation(anonymized_datasource_validator):
     record = {
         "anonymized_name": "aa41efe0a1b3eeb9bf303e4561ff8392",
         "parent_class": "hello",
     }
-    jsonschema.validate(record, anonymized_datasource_schema)
+    anonymized_datasource_validator.validate(record)
 
     record = {
         "anonymized_name": "aa41efe0a1b3eeb9bf303e4561ff8392",
         "parent_class": "hello",
         "anonymized_class": "aa41efe0a1b3eeb9bf303e4561ff8392",
     }
-    jsonschema.validate(record, anonymized_datasource_schema)
+    anonymized_datasource_validator.validate(record)
     record = {
         "anonymized_name": "aa41efe0a1b3eeb9bf303e4561ff8392",
         "parent_class": "SparkDFDataset",
         "anonymized_class": "aa41efe0a1b3eeb9bf303e4561ff8392",
         "sqlalchemy_dialect": "postgres",
     }
-    jsonschema.validate(record, anonymized_datasource_schema)
+    anonymized_datasource_validator.validate(record)
 
 
-def test_init_payload_validation():
+def test_init_payload_validation(init_payload_validator):
     payload = {
         "platform.system": "Darwin",
         "platform.release": "19.3.0",
@@ -121,10 +147,10 @@ def test_init_payload_validation():
             }
         ],
     }
-    jsonschema.validate(payload, init_payload_schema)
+    init_payload_validator.validate(payload)
 
 
-def test_run_val_op_message():
+def test_run_val_op_message(usage_statistics_record_validator):
     message = {
         "event_payload": {
             "anonymized_operator_name": "50daa62a8739db21009f452f7e36153b",
@@ -137,4 +163,4 @@ def test_run_val_op_message():
         "data_context_instance_id": "4f6deb55-8fbd-4131-9f97-b42b0902eae5",
         "ge_version": "0.9.7+203.ge3a97f44.dirty",
     }
-    jsonschema.validate(message, usage_statistics_record_schema)
+    usage_statistics_record_validator.validate(message)
@@ -1,9 +1,6 @@
-import configparser
 import os
 import shutil
-from copy import deepcopy
 
-import mock
 import pytest
 
 from great_expectations.core.usage_statistics.usage_statistics import (
@@ -16,6 +13,15 @@ from tests.integration.usage_statistics.test_integration_usage_statistics import
     USAGE_STATISTICS_QA_URL,
 )
 
+FIXTURE_DIR = file_relative_path(__file__, "../../test_fixtures")
+FALSE_STRINGS = ["False", "false", "f", "FALSE"]
+
+
+@pytest.fixture(autouse=True)
+def enable_usage_stats(monkeypatch):
+    # Undo the project-wide test default
+    monkeypatch.delenv("GE_USAGE_STATS", raising=False)
+
 
 @pytest.fixture
 def in_memory_data_context_config_usage_stats_enabled():
@@ -52,12 +58,46 @@ def in_memory_data_context_config_usage_stats_enabled():
     )
 
 
+@pytest.fixture
+def global_config_paths(tmp_path_factory, monkeypatch):
+    """Patch BaseDataContext.GLOBAL_CONFIG_PATHS to temp [home, etc] conf paths"""
+    config_paths = [
+        os.path.join(
+            str(tmp_path_factory.mktemp(config_dir)), "great_expectations.conf"
+        )
+        for config_dir in ("home_dir", "etc")
+    ]
+    monkeypatch.setattr(
+        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
+        config_paths,
+    )
+    return config_paths
+
+
+def _build_context_dir(tmp_path_factory, fixture_yml):
+    """Create a context root dir whose great_expectations.yml is a copy of a fixture
+
+    The fixture is copied, not symlinked: DataContext saves its project config back to
+    great_expectations.yml whenever a global override changes it.
+    """
+    project_path = str(tmp_path_factory.mktemp("data_context"))
+    context_path = os.path.join(project_path, "great_expectations")
+    os.makedirs(context_path, exist_ok=True)
+    shutil.copy(
+        os.path.join(FIXTURE_DIR, fixture_yml),
+        os.path.join(context_path, "great_expectations.yml"),
+    )
+    return context_path
+
+
+def _write_conf(path, enabled):
+    with open(path, "w") as configfile:
+        configfile.write(f"[anonymous_usage_statistics]\nenabled = {enabled}\n")
+
+
 def test_consistent_name_anonymization(
-    in_memory_data_context_config_usage_stats_enabled, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled,
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
     context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
     assert context.data_context_id == "00000000-0000-0000-0000-000000000001"
     payload = run_validation_operator_usage_statistics(
@@ -86,103 +126,47 @@ def test_opt_out_environment_variable(
     assert project_config.anonymous_usage_statistics.enabled is False
 
 
+@pytest.mark.parametrize("false_string", FALSE_STRINGS)
 def test_opt_out_etc(
-    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled,
+    global_config_paths,
+    false_string,
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    _, etc_config_path = global_config_paths
+
+    _write_conf(etc_config_path, false_string)
 
-    for false_string in ["False", "false", "f", "FALSE"]:
-        disabled_config = configparser.ConfigParser()
-        disabled_config["anonymous_usage_statistics"] = {"enabled": false_string}
-
-        with open(
-            os.path.join(etc_config_dir, "great_expectations.conf"), "w"
-        ) as configfile:
-            disabled_config.write(configfile)
-
-        with mock.patch(
-            "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-            config_dirs,
-        ):
-            assert (
-                in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
-                is True
-            )
-            context = BaseDataContext(
-                deepcopy(in_memory_data_context_config_usage_stats_enabled)
-            )
-            project_config = context._project_config
-            assert project_config.anonymous_usage_statistics.enabled is False
+    assert (
+        in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
+        is True
+    )
+    context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
 
 
+@pytest.mark.parametrize("false_string", FALSE_STRINGS)
 def test_opt_out_home_folder(
-    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled,
+    global_config_paths,
+    false_string,
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    home_config_path, _ = global_config_paths
 
-    enabled_config = configparser.ConfigParser()
-    enabled_config["anonymous_usage_statistics"] = {"enabled": "True"}
-
-    for false_string in ["False", "false", "f", "FALSE"]:
-        disabled_config = configparser.ConfigParser()
-        disabled_config["anonymous_usage_statistics"] = {"enabled": false_string}
-
-        with open(
-            os.path.join(home_config_dir, "great_expectations.conf"), "w"
-        ) as configfile:
-            disabled_config.write(configfile)
-
-        with mock.patch(
-            "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-            config_dirs,
-        ):
-            assert (
-                in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
-                is True
-            )
-            context = BaseDataContext(
-                deepcopy(in_memory_data_context_config_usage_stats_enabled)
-            )
-            project_config = context._project_config
-            assert project_config.anonymous_usage_statistics.enabled is False
-
-
-def test_opt_out_yml(tmp_path_factory, monkeypatch):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    project_path = str(tmp_path_factory.mktemp("data_context"))
-    context_path = os.path.join(project_path, "great_expectations")
-    os.makedirs(context_path, exist_ok=True)
-    fixture_dir = file_relative_path(__file__, "../../test_fixtures")
+    _write_conf(home_config_path, false_string)
 
-    shutil.copy(
-        os.path.join(
-            fixture_dir, "great_expectations_basic_with_usage_stats_disabled.yml"
-        ),
-        str(os.path.join(context_path, "great_expectations.yml")),
+    assert (
+        in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
+        is True
+    )
+    context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
+
+
+def test_opt_out_yml(tmp_path_factory):
+    context_path = _build_context_dir(
+        tmp_path_factory, "great_expectations_basic_with_usage_stats_disabled.yml"
     )
 
     assert (
@@ -195,97 +179,44 @@ def test_opt_out_yml(tmp_path_factory, monkeypatch):
 
 # Test precedence: environment variable > home folder > /etc > yml
 def test_opt_out_env_var_overrides_home_folder(
-    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled, global_config_paths, monkeypatch
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
-
-    enabled_config = configparser.ConfigParser()
-    enabled_config["anonymous_usage_statistics"] = {"enabled": "True"}
+    home_config_path, _ = global_config_paths
 
-    with open(
-        os.path.join(home_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        enabled_config.write(configfile)
+    _write_conf(home_config_path, "True")
 
     monkeypatch.setenv("GE_USAGE_STATS", "False")
 
-    with mock.patch(
-        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-        config_dirs,
-    ):
-        assert (
-            in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
-            is True
-        )
-        context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
-        project_config = context._project_config
-        assert project_config.anonymous_usage_statistics.enabled is False
+    assert (
+        in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
+        is True
+    )
+    context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
 
 
 def test_opt_out_env_var_overrides_etc(
-    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled, global_config_paths, monkeypatch
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    _, etc_config_path = global_config_paths
 
-    enabled_config = configparser.ConfigParser()
-    enabled_config["anonymous_usage_statistics"] = {"enabled": "True"}
-
-    with open(
-        os.path.join(etc_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        enabled_config.write(configfile)
+    _write_conf(etc_config_path, "True")
 
     monkeypatch.setenv("GE_USAGE_STATS", "False")
 
-    with mock.patch(
-        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-        config_dirs,
-    ):
-        assert (
-            in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
-            is True
-        )
-        context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
-        project_config = context._project_config
-        assert project_config.anonymous_usage_statistics.enabled is False
+    assert (
+        in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
+        is True
+    )
+    context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
 
 
 def test_opt_out_env_var_overrides_yml(tmp_path_factory, monkeypatch):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    project_path = str(tmp_path_factory.mktemp("data_context"))
-    context_path = os.path.join(project_path, "great_expectations")
-    os.makedirs(context_path, exist_ok=True)
-    fixture_dir = file_relative_path(__file__, "../../test_fixtures")
-
-    shutil.copy(
-        os.path.join(
-            fixture_dir, "great_expectations_basic_with_usage_stats_enabled.yml"
-        ),
-        str(os.path.join(context_path, "great_expectations.yml")),
+    context_path = _build_context_dir(
+        tmp_path_factory, "great_expectations_basic_with_usage_stats_enabled.yml"
     )
 
     assert (
@@ -302,81 +233,27 @@ def test_opt_out_env_var_overrides_yml(tmp_path_factory, monkeypatch):
 
 
 def test_opt_out_home_folder_overrides_etc(
-    in_memory_data_context_config_usage_stats_enabled, tmp_path_factory, monkeypatch
+    in_memory_data_context_config_usage_stats_enabled, global_config_paths
 ):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    home_config_path, etc_config_path = global_config_paths
 
-    enabled_config = configparser.ConfigParser()
-    enabled_config["anonymous_usage_statistics"] = {"enabled": "True"}
-
-    disabled_config = configparser.ConfigParser()
-    disabled_config["anonymous_usage_statistics"] = {"enabled": "False"}
-
-    with open(
-        os.path.join(home_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        disabled_config.write(configfile)
-    with open(
-        os.path.join(etc_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        enabled_config.write(configfile)
-
-    with mock.patch(
-        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-        config_dirs,
-    ):
-        assert (
-            in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
-            is True
-        )
-        context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
-        project_config = context._project_config
-        assert project_config.anonymous_usage_statistics.enabled is False
-
-
-def test_opt_out_home_folder_overrides_yml(tmp_path_factory, monkeypatch):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    _write_conf(home_config_path, "False")
+    _write_conf(etc_config_path, "True")
 
-    disabled_config = configparser.ConfigParser()
-    disabled_config["anonymous_usage_statistics"] = {"enabled": "False"}
+    assert (
+        in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.enabled
+        is True
+    )
+    context = BaseDataContext(in_memory_data_context_config_usage_stats_enabled)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
 
-    with open(
-        os.path.join(home_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        disabled_config.write(configfile)
 
-    project_path = str(tmp_path_factory.mktemp("data_context"))
-    context_path = os.path.join(project_path, "great_expectations")
-    os.makedirs(context_path, exist_ok=True)
-    fixture_dir = file_relative_path(__file__, "../../test_fixtures")
+def test_opt_out_home_folder_overrides_yml(global_config_paths, tmp_path_factory):
+    home_config_path, _ = global_config_paths
 
-    shutil.copy(
-        os.path.join(
-            fixture_dir, "great_expectations_basic_with_usage_stats_enabled.yml"
-        ),
-        str(os.path.join(context_path, "great_expectations.yml")),
+    context_path = _build_context_dir(
+        tmp_path_factory, "great_expectations_basic_with_usage_stats_enabled.yml"
     )
 
     assert (
@@ -386,47 +263,18 @@ def test_opt_out_home_folder_overrides_yml(tmp_path_factory, monkeypatch):
         is True
     )
 
-    with mock.patch(
-        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-        config_dirs,
-    ):
-        context = DataContext(context_root_dir=context_path)
-        project_config = context._project_config
-        assert project_config.anonymous_usage_statistics.enabled is False
-
-
-def test_opt_out_etc_overrides_yml(tmp_path_factory, monkeypatch):
-    monkeypatch.delenv(
-        "GE_USAGE_STATS", raising=False
-    )  # Undo the project-wide test default
-    home_config_dir = tmp_path_factory.mktemp("home_dir")
-    home_config_dir = str(home_config_dir)
-    etc_config_dir = tmp_path_factory.mktemp("etc")
-    etc_config_dir = str(etc_config_dir)
-    config_dirs = [home_config_dir, etc_config_dir]
-    config_dirs = [
-        os.path.join(config_dir, "great_expectations.conf")
-        for config_dir in config_dirs
-    ]
+    _write_conf(home_config_path, "False")
 
-    disabled_config = configparser.ConfigParser()
-    disabled_config["anonymous_usage_statistics"] = {"enabled": "False"}
+    context = DataContext(context_root_dir=context_path)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False
 
-    with open(
-        os.path.join(etc_config_dir, "great_expectations.conf"), "w"
-    ) as configfile:
-        disabled_config.write(configfile)
 
-    project_path = str(tmp_path_factory.mktemp("data_context"))
-    context_path = os.path.join(project_path, "great_expectations")
-    os.makedirs(context_path, exist_ok=True)
-    fixture_dir = file_relative_path(__file__, "../../test_fixtures")
+def test_opt_out_etc_overrides_yml(global_config_paths, tmp_path_factory):
+    _, etc_config_path = global_config_paths
 
-    shutil.copy(
-        os.path.join(
-            fixture_dir, "great_expectations_basic_with_usage_stats_enabled.yml"
-        ),
-        str(os.path.join(context_path, "great_expectations.yml")),
+    context_path = _build_context_dir(
+        tmp_path_factory, "great_expectations_basic_with_usage_stats_enabled.yml"
     )
 
     assert (
@@ -436,10 +284,8 @@ def test_opt_out_etc_overrides_yml(tmp_path_factory, monkeypatch):
         is True
     )
 
-    with mock.patch(
-        "great_expectations.data_context.BaseDataContext.GLOBAL_CONFIG_PATHS",
-        config_dirs,
-    ):
-        context = DataContext(context_root_dir=context_path)
-        project_config = context._project_config
-        assert project_config.anonymous_usage_statistics.enabled is False
+    _write_conf(etc_config_path, "False")
+
+    context = DataContext(context_root_dir=context_path)
+    project_config = context._project_config
+    assert project_config.anonymous_usage_statistics.enabled is False